@@ -0,0 +1,154 @@
+"""On-disk cache of parsed documentation, so restarts don't re-fetch everything.
+
+Entries are keyed by a hash of the source's config, the URL and the package
+version, so editing a source (or upgrading the parsers) makes its old entries
+unreachable instead of serving them stale. Unreachable entries are removed by
+sweep() once they stop being rewritten.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live for cached entries, overridable via `cache_ttl_hours` in config
+DEFAULT_TTL_HOURS = 24.0
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "flywheel-gear-mcp"
+)
+
+# Entries not rewritten for this long are deleted by sweep()
+MAX_ENTRY_AGE_DAYS = 30
+
+
+async def load(source: dict[str, Any], url: str) -> dict[str, Any] | None:
+    """Load the cached entry for a URL of a documentation source.
+
+    Args:
+        source: Source configuration from YAML
+        url: Source URL
+
+    Returns:
+        Cache entry dict, or None if missing or unreadable
+    """
+    path = _cache_path(source, url)
+    try:
+        async with aiofiles.open(path, "rb") as f:
+            data = await f.read()
+        return json.loads(gzip.decompress(data))
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+
+def save(
+    source: dict[str, Any],
+    url: str,
+    content: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> None:
+    """Write parsed content for a URL of a documentation source to the cache.
+
+    Args:
+        source: Source configuration from YAML
+        url: Source URL
+        content: Parsed markdown content
+        etag: ETag response header, for conditional revalidation
+        last_modified: Last-Modified response header, for conditional revalidation
+    """
+    entry = {
+        "url": url,
+        "content": content,
+        "cached_at": time.time(),
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+    path = _cache_path(source, url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(gzip.compress(json.dumps(entry).encode("utf-8")))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {path}: {e}")
+
+
+def is_fresh(entry: dict[str, Any], ttl_hours: float) -> bool:
+    """Check whether a cache entry is younger than the TTL.
+
+    Args:
+        entry: Cache entry
+        ttl_hours: Time-to-live in hours
+
+    Returns:
+        True if the entry can be served without revalidation
+    """
+    return time.time() - entry.get("cached_at", 0) < ttl_hours * 3600
+
+
+def revalidation_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+    """Build conditional request headers from a cache entry.
+
+    Args:
+        entry: Cache entry, or None
+
+    Returns:
+        Headers for a conditional GET (empty if there are no validators)
+    """
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def sweep(max_age_days: float = MAX_ENTRY_AGE_DAYS) -> None:
+    """Delete cache files that haven't been written for max_age_days.
+
+    Args:
+        max_age_days: Age in days after which files are deleted
+    """
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in CACHE_DIR.glob("*/*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError as e:
+            logger.warning(f"Failed to remove old cache file {path}: {e}")
+
+    # Drop directories of tools that no longer have any entries
+    for path in CACHE_DIR.glob("*/"):
+        try:
+            path.rmdir()
+        except OSError:
+            pass  # Not empty
+
+    if removed:
+        logger.info(f"Removed {removed} old cache file(s) from {CACHE_DIR}")
+
+
+def _cache_path(source: dict[str, Any], url: str) -> Path:
+    """Get the cache file path for a URL of a documentation source."""
+    key_data = json.dumps({"source": source, "url": url}, sort_keys=True)
+    cache_key = hashlib.sha256((key_data + __version__).encode("utf-8")).hexdigest()
+    return CACHE_DIR / source["tool_name"] / f"{cache_key}.json.gz"
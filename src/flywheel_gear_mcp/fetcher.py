@@ -2,19 +2,35 @@
 
 import asyncio
 import logging
+import multiprocessing
+import random
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
+import aiofiles
 import httpx
 import yaml
 
-from . import parsers
+from . import cache, parsers
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
-# Global cache for documentation
+# Global cache for documentation. Writers build a new dict and rebind this name
+# rather than mutating it in place, so readers can use it without copying.
 _docs_cache: dict[str, dict[str, Any]] = {}
 
+# Serializes writers of _docs_cache (startup load and background refresh)
+_docs_cache_lock = asyncio.Lock()
+
 
 async def fetch_all_docs(config_path: str = "config.yaml") -> dict[str, dict[str, Any]]:
     """Fetch all documentation sources defined in config file.
@@ -37,25 +53,51 @@ async def fetch_all_docs(config_path: str = "config.yaml") -> dict[str, dict[str
     """
     global _docs_cache
 
-    # Load configuration
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-
+    config = await _load_config(config_path)
     sources = config.get("documentation_sources", [])
+    ttl_hours = config.get("cache_ttl_hours", cache.DEFAULT_TTL_HOURS)
     logger.info(f"Fetching {len(sources)} documentation sources...")
 
-    # Fetch all sources in parallel
-    tasks = [_fetch_source(source) for source in sources]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Fetch all sources in parallel over a shared connection pool, parsing in
+    # worker processes so CPU-heavy parses don't stall the event loop. Workers
+    # are only spawned once something needs parsing (i.e. not on cache hits).
+    pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    try:
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        ) as client:
+            tasks = [
+                _fetch_source(client, source, ttl_hours, pool) for source in sources
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Don't wait for workers on the event loop (a cancelled refresh may
+        # still have a parse running); the executor reaps them in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Build cache, keeping previously served content for sources that failed
+    async with _docs_cache_lock:
+        new_cache = {}
+        for source, result in zip(sources, results):
+            tool_name = source["tool_name"]
+
+            if not isinstance(result, Exception):
+                new_cache[tool_name] = result
+                continue
+
+            previous = _docs_cache.get(tool_name)
+            if previous and "error" not in previous:
+                logger.warning(
+                    f"Failed to refresh {tool_name}, keeping previous content: {result}"
+                )
+                new_cache[tool_name] = previous
+                continue
 
-    # Build cache
-    _docs_cache = {}
-    for source, result in zip(sources, results):
-        tool_name = source["tool_name"]
-
-        if isinstance(result, Exception):
             logger.error(f"Failed to fetch {tool_name}: {result}")
-            _docs_cache[tool_name] = {
+            new_cache[tool_name] = {
                 "content": f"# Error\n\nFailed to fetch documentation: {result}",
                 "display_name": source.get("display_name", tool_name),
                 "description": source.get("description", ""),
@@ -64,89 +106,244 @@ async def fetch_all_docs(config_path: str = "config.yaml") -> dict[str, dict[str
                 "size": 0,
                 "error": str(result),
             }
-        else:
-            _docs_cache[tool_name] = result
+
+        _docs_cache = new_cache
 
     logger.info(f"Successfully cached {len(_docs_cache)} documentation sources")
+
+    # Live entries are rewritten at least once per TTL, so older files are orphaned
+    cache.sweep(max(cache.MAX_ENTRY_AGE_DAYS, ttl_hours / 24))
     return _docs_cache
 
 
-async def _fetch_source(source: dict[str, Any]) -> dict[str, Any]:
+async def load_cached_docs(config_path: str = "config.yaml") -> bool:
+    """Populate the documentation cache from the on-disk cache, ignoring TTL.
+
+    Used at startup to serve possibly stale docs immediately while a refresh
+    runs in the background.
+
+    Args:
+        config_path: Path to YAML configuration file
+
+    Returns:
+        True if every source had cached content, False otherwise (in which
+        case the in-memory cache is left untouched)
+    """
+    global _docs_cache
+
+    config = await _load_config(config_path)
+    sources = config.get("documentation_sources", [])
+
+    new_cache = {}
+    for source in sources:
+        entries = await asyncio.gather(
+            *[cache.load(source, url) for url in source.get("urls", [])]
+        )
+        results = [
+            (entry["content"], datetime.fromtimestamp(entry["cached_at"]))
+            for entry in entries
+            if entry
+        ]
+        if not results:
+            logger.info(f"No cached content for {source['tool_name']}")
+            return False
+        new_cache[source["tool_name"]] = _build_doc(source, results)
+
+    async with _docs_cache_lock:
+        _docs_cache = new_cache
+
+    logger.info(f"Loaded {len(new_cache)} documentation sources from disk cache")
+    return True
+
+
+async def _load_config(config_path: str) -> dict[str, Any]:
+    """Load the YAML configuration file.
+
+    Args:
+        config_path: Path to YAML configuration file
+
+    Returns:
+        Parsed configuration dict
+    """
+    async with aiofiles.open(config_path, "r") as f:
+        text = await f.read()
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+async def _fetch_source(
+    client: httpx.AsyncClient,
+    source: dict[str, Any],
+    ttl_hours: float = cache.DEFAULT_TTL_HOURS,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
     """Fetch a single documentation source.
 
     Args:
+        client: Shared httpx AsyncClient
         source: Source configuration from YAML
+        ttl_hours: How long on-disk cache entries are served without revalidation
+        executor: Executor to parse content in (defaults to the loop's executor)
 
     Returns:
         Documentation metadata dict
     """
     tool_name = source["tool_name"]
     urls = source.get("urls", [])
-    doc_type = source.get("type", "html")
-    strip_deprecated = source.get("strip_deprecated", True)
-    filter_sections = source.get("filter_sections")
 
     logger.info(f"Fetching {tool_name} from {len(urls)} URL(s)...")
 
-    # Fetch all URLs for this source
-    contents = []
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        for url in urls:
-            content = await _fetch_with_retry(client, url)
-            if content:
-                contents.append(content)
+    # Fetch and parse all URLs for this source concurrently
+    results = await asyncio.gather(
+        *[_fetch_url(client, url, source, ttl_hours, executor) for url in urls]
+    )
+    results = [result for result in results if result]
 
-    if not contents:
+    if not results:
         raise ValueError(f"No content fetched for {tool_name}")
 
-    # Parse based on type
-    parsed_contents = []
-    for content in contents:
-        if doc_type == "html":
-            parsed = parsers.parse_html(content, urls[0], strip_deprecated)
-        elif doc_type == "xml":
-            parsed = parsers.parse_xml(content, filter_sections)
-        elif doc_type == "json":
-            parsed = parsers.parse_json_schema(content)
-        elif doc_type == "gitlab_repo":
-            parsed = parsers.parse_gitlab_repo(content, strip_deprecated)
-        else:
-            parsed = content  # Unknown type, store as-is
-
-        parsed_contents.append(parsed)
+    return _build_doc(source, results)
+
+
+def _build_doc(
+    source: dict[str, Any], results: list[tuple[str, datetime]]
+) -> dict[str, Any]:
+    """Combine parsed URL contents into a documentation metadata dict.
+
+    Args:
+        source: Source configuration from YAML
+        results: (parsed content, fetch time) pairs, one per URL
+
+    Returns:
+        Documentation metadata dict
+    """
+    tool_name = source["tool_name"]
 
     # Combine all contents
-    combined_content = "\n\n---\n\n".join(parsed_contents)
+    combined_content = "\n\n---\n\n".join(parsed for parsed, _ in results)
 
     return {
         "content": combined_content,
         "display_name": source.get("display_name", tool_name),
         "description": source.get("description", ""),
-        "urls": urls,
-        "fetched_at": datetime.now(),
+        "urls": source.get("urls", []),
+        "fetched_at": min(fetched_at for _, fetched_at in results),
         "size": len(combined_content),
     }
 
 
+async def _fetch_url(
+    client: httpx.AsyncClient,
+    url: str,
+    source: dict[str, Any],
+    ttl_hours: float,
+    executor: Executor | None = None,
+) -> tuple[str, datetime] | None:
+    """Fetch and parse a single URL, going through the on-disk cache.
+
+    Fresh cache entries are served without a request. Stale entries are
+    revalidated with a conditional GET, and are also served if the fetch fails.
+
+    Args:
+        client: Shared httpx AsyncClient
+        url: URL to fetch
+        source: Source configuration from YAML
+        ttl_hours: How long cache entries are served without revalidation
+        executor: Executor to parse content in (defaults to the loop's executor)
+
+    Returns:
+        Tuple of (parsed content, fetch time), or None if nothing was fetched
+    """
+    entry = await cache.load(source, url)
+    if entry and cache.is_fresh(entry, ttl_hours):
+        logger.debug(f"Using cached {url}")
+        return entry["content"], datetime.fromtimestamp(entry["cached_at"])
+
+    try:
+        response = await _fetch_with_retry(
+            client, url, headers=cache.revalidation_headers(entry)
+        )
+    except httpx.HTTPError as e:
+        if not entry:
+            raise
+        logger.warning(f"Fetch failed for {url}, serving stale cache: {e}")
+        return entry["content"], datetime.fromtimestamp(entry["cached_at"])
+
+    if response is None:
+        return None
+
+    if response.status_code == 304 and entry:
+        logger.debug(f"{url} not modified, refreshing cache entry")
+        cache.save(
+            source, url, entry["content"], entry.get("etag"), entry.get("last_modified")
+        )
+        return entry["content"], datetime.now()
+
+    loop = asyncio.get_running_loop()
+    parsed = await loop.run_in_executor(
+        executor, _parse_content, response.text, url, source
+    )
+    cache.save(
+        source,
+        url,
+        parsed,
+        response.headers.get("etag"),
+        response.headers.get("last-modified"),
+    )
+    return parsed, datetime.now()
+
+
+def _parse_content(content: str, url: str, source: dict[str, Any]) -> str:
+    """Parse raw content based on the source's type.
+
+    Args:
+        content: Raw fetched content
+        url: URL the content was fetched from
+        source: Source configuration from YAML
+
+    Returns:
+        Parsed markdown content
+    """
+    doc_type = source.get("type", "html")
+    strip_deprecated = source.get("strip_deprecated", True)
+    filter_sections = source.get("filter_sections")
+
+    if doc_type == "html":
+        return parsers.parse_html(content, url, strip_deprecated)
+    elif doc_type == "xml":
+        return parsers.parse_xml(content, filter_sections)
+    elif doc_type == "json":
+        return parsers.parse_json_schema(content)
+    elif doc_type == "gitlab_repo":
+        return parsers.parse_gitlab_repo(content, strip_deprecated)
+    else:
+        return content  # Unknown type, store as-is
+
+
 async def _fetch_with_retry(
-    client: httpx.AsyncClient, url: str, max_retries: int = 3
-) -> str | None:
+    client: httpx.AsyncClient,
+    url: str,
+    max_retries: int = 3,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response | None:
     """Fetch URL with exponential backoff retry.
 
     Args:
         client: httpx AsyncClient
         url: URL to fetch
         max_retries: Maximum number of retry attempts
+        headers: Extra request headers (e.g. conditional revalidation headers)
 
     Returns:
-        Content as string, or None if all retries failed
+        Successful or 304 Not Modified response, or None if all retries failed
     """
     for attempt in range(max_retries):
         try:
             logger.debug(f"Fetching {url} (attempt {attempt + 1}/{max_retries})")
-            response = await client.get(url)
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
-            return response.text
+            return response
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"HTTP error {e.response.status_code} for {url}")
@@ -155,20 +352,34 @@ async def _fetch_with_retry(
                 return None
             # Retry server errors
             if attempt < max_retries - 1:
-                await asyncio.sleep(2**attempt)  # Exponential backoff
+                await asyncio.sleep(_backoff_delay(attempt))
             else:
                 raise
 
         except (httpx.RequestError, httpx.TimeoutException) as e:
             logger.warning(f"Request error for {url}: {e}")
             if attempt < max_retries - 1:
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(_backoff_delay(attempt))
             else:
                 raise
 
     return None
 
 
+def _backoff_delay(attempt: int, max_delay: float = 30.0) -> float:
+    """Exponential backoff with jitter so concurrent retries don't stampede.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        max_delay: Upper bound on the delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    delay = (2**attempt) * (1 + random.random() * 0.5)
+    return min(delay, max_delay)
+
+
 def get_cached_doc(tool_name: str) -> dict[str, Any] | None:
     """Get cached documentation for a tool.
 
@@ -181,10 +392,10 @@ def get_cached_doc(tool_name: str) -> dict[str, Any] | None:
     return _docs_cache.get(tool_name)
 
 
-def get_all_cached_docs() -> dict[str, dict[str, Any]]:
+def get_all_cached_docs() -> Mapping[str, dict[str, Any]]:
     """Get all cached documentation.
 
     Returns:
-        Complete cache dictionary
+        Read-only view of the current cache snapshot
     """
-    return _docs_cache.copy()
+    return MappingProxyType(_docs_cache)
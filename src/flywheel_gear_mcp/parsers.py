@@ -1,12 +1,30 @@
 """Documentation parsers for different content types."""
 
-import json
 import re
-from typing import Optional
+from io import BytesIO
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
-from lxml import etree
-from markdownify import markdownify as md
+import orjson
+
+# bs4, lxml and markdownify are imported inside the parsers that need them, so
+# loading this module (e.g. for JSON-only sources) doesn't pay for all three
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+# Consecutive blank (or whitespace-only) lines, collapsed to a single blank line
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+
+# Markers that identify a document as HTML rather than raw markdown
+_HTML_MARKERS = ("<html", "<!doctype", "<body")
+
+# Markers for deprecated content, matched against headings, class/id and badges
+_DEPRECATED_RE = re.compile(r"deprecat|legacy|obsolete", re.IGNORECASE)
+
+# Local names of DICOM XML elements that make up the data dictionary
+_DICOM_DATA_ELEMENT_NAMES = frozenset({"DataElement", "tag"})
+
+# Limit the data dictionary table for brevity (the full table would flood the context)
+_MAX_DATA_DICTIONARY_ROWS = 100
 
 
 def parse_html(content: str, url: str, strip_deprecated: bool = True) -> str:
@@ -20,7 +38,10 @@ def parse_html(content: str, url: str, strip_deprecated: bool = True) -> str:
     Returns:
         Clean markdown documentation
     """
-    soup = BeautifulSoup(content, "html.parser")
+    from bs4 import BeautifulSoup
+    from markdownify import MarkdownConverter
+
+    soup = BeautifulSoup(content, "lxml")
 
     # Remove unwanted elements
     for element in soup.find_all(
@@ -50,11 +71,13 @@ def parse_html(content: str, url: str, strip_deprecated: bool = True) -> str:
     if strip_deprecated:
         main_content = _remove_deprecated_sections(main_content)
 
-    # Convert to markdown
-    markdown = md(str(main_content), heading_style="ATX", bullets="-")
+    # Convert the already-parsed tree to markdown (avoids a str() + re-parse)
+    markdown = MarkdownConverter(heading_style="ATX", bullets="-").convert_soup(
+        main_content
+    )
 
     # Clean up excessive whitespace
-    markdown = re.sub(r"\n\s*\n\s*\n+", "\n\n", markdown)
+    markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
     markdown = markdown.strip()
 
     return markdown
@@ -70,24 +93,28 @@ def parse_xml(content: str, filter_sections: Optional[list[str]] = None) -> str:
     Returns:
         Formatted markdown documentation from XML
     """
-    try:
-        root = etree.fromstring(content.encode("utf-8"))
-    except Exception:
-        # If full parse fails, try to extract just the relevant parts
-        root = etree.fromstring(
-            content.encode("utf-8"), parser=etree.XMLParser(recover=True)
-        )
-
     output_lines = ["# DICOM Standard Documentation\n"]
 
-    # If filter_sections specified, extract only those
+    # If filter_sections specified, stream the document and extract only those
     if filter_sections:
+        data_dict_elements, ts_elements = _scan_dicom_xml(content)
+
         if "data_dictionary" in filter_sections:
-            output_lines.extend(_extract_dicom_data_dictionary(root))
+            output_lines.extend(_extract_dicom_data_dictionary(data_dict_elements))
 
         if "transfer_syntaxes" in filter_sections:
-            output_lines.extend(_extract_dicom_transfer_syntaxes(root))
+            output_lines.extend(_extract_dicom_transfer_syntaxes(ts_elements))
     else:
+        from lxml import etree
+
+        try:
+            root = etree.fromstring(content.encode("utf-8"))
+        except Exception:
+            # If full parse fails, try to extract just the relevant parts
+            root = etree.fromstring(
+                content.encode("utf-8"), parser=etree.XMLParser(recover=True)
+            )
+
         # Extract all content
         text = etree.tostring(root, encoding="unicode", method="text")
         output_lines.append(text)
@@ -105,7 +132,7 @@ def parse_json_schema(content: str) -> str:
         Pretty-formatted JSON with descriptions
     """
     try:
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         # Create a more readable markdown format
         output = ["# Gear Manifest JSON Schema\n"]
@@ -131,19 +158,20 @@ def parse_json_schema(content: str) -> str:
         # Also include raw JSON for reference
         output.append("## Full Schema (JSON)\n")
         output.append("```json")
-        output.append(json.dumps(data, indent=2))
+        output.append(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8"))
         output.append("```")
 
         return "\n".join(output)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return f"# Error Parsing JSON Schema\n\nFailed to parse JSON: {e}\n\n```\n{content}\n```"
 
 
 def parse_gitlab_repo(content: str, strip_deprecated: bool = True) -> str:
     """Parse markdown content from GitLab repository.
 
-    For now, this is similar to HTML parsing but specific to GitLab's markdown.
+    Rendered GitLab pages go through the HTML pipeline; raw markdown (e.g. from
+    a raw .md endpoint) is returned as-is apart from whitespace cleanup.
     Future enhancement: could fetch repo tree and combine multiple .md files.
 
     Args:
@@ -153,6 +181,11 @@ def parse_gitlab_repo(content: str, strip_deprecated: bool = True) -> str:
     Returns:
         Clean markdown documentation
     """
+    # Raw .md endpoints are already markdown; skip the HTML pipeline entirely
+    head = content[:512].lower()
+    if not any(marker in head for marker in _HTML_MARKERS):
+        return _BLANK_LINES_RE.sub("\n\n", content).strip()
+
     # GitLab renders markdown as HTML, so parse it similarly
     return parse_html(content, "", strip_deprecated)
 
@@ -160,7 +193,7 @@ def parse_gitlab_repo(content: str, strip_deprecated: bool = True) -> str:
 # Helper functions
 
 
-def _remove_deprecated_sections(soup: BeautifulSoup) -> BeautifulSoup:
+def _remove_deprecated_sections(soup: "BeautifulSoup") -> "BeautifulSoup":
     """Remove sections marked as deprecated from BeautifulSoup object.
 
     Args:
@@ -169,36 +202,29 @@ def _remove_deprecated_sections(soup: BeautifulSoup) -> BeautifulSoup:
     Returns:
         Cleaned BeautifulSoup object
     """
-    deprecated_patterns = [
-        re.compile(r"deprecat", re.IGNORECASE),
-        re.compile(r"legacy", re.IGNORECASE),
-        re.compile(r"obsolete", re.IGNORECASE),
-    ]
-
-    # Find elements containing deprecated markers
-    for pattern in deprecated_patterns:
-        # Check headings
-        for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            if pattern.search(heading.get_text()):
-                # Remove the heading and all content until the next heading of same/higher level
-                _remove_section(heading)
-
-        # Check divs and sections with deprecated in class or id
-        for element in soup.find_all(["div", "section", "article"]):
-            classes = element.get("class", [])
-            element_id = element.get("id", "")
-            if any(pattern.search(str(c)) for c in classes) or pattern.search(
-                element_id
-            ):
-                element.decompose()
-
-        # Check for deprecated badges/labels
-        for element in soup.find_all(["span", "div", "p"]):
-            if pattern.search(element.get_text()) and len(element.get_text()) < 50:
-                # If it's a short text (likely a badge), remove parent
-                parent = element.find_parent(["div", "section", "article"])
-                if parent:
-                    parent.decompose()
+    # Check headings
+    for heading in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
+        if _DEPRECATED_RE.search(heading.get_text()):
+            # Remove the heading and all content until the next heading of same/higher level
+            _remove_section(heading)
+
+    # Check divs and sections with deprecated in class or id
+    for element in soup.find_all(["div", "section", "article"]):
+        classes = element.get("class", [])
+        element_id = element.get("id", "")
+        if any(_DEPRECATED_RE.search(str(c)) for c in classes) or _DEPRECATED_RE.search(
+            element_id
+        ):
+            element.decompose()
+
+    # Check for deprecated badges/labels
+    for element in soup.find_all(["span", "div", "p"]):
+        text = element.get_text()
+        if len(text) < 50 and _DEPRECATED_RE.search(text):
+            # If it's a short text (likely a badge), remove parent
+            parent = element.find_parent(["div", "section", "article"])
+            if parent:
+                parent.decompose()
 
     return soup
 
@@ -220,32 +246,98 @@ def _remove_section(heading):
     heading.decompose()
 
 
-def _extract_dicom_data_dictionary(root) -> list[str]:
-    """Extract DICOM data dictionary from XML root.
+def _scan_dicom_xml(
+    content: str,
+) -> tuple[list[tuple[dict, Optional[str]]], list[tuple[dict, Optional[str]]]]:
+    """Stream DICOM XML once, collecting data dictionary and transfer syntax elements.
+
+    Elements are cleared as soon as they have been inspected, so peak memory stays
+    bounded even for the full DICOM standard.
 
     Args:
-        root: XML root element
+        content: Raw XML content
+
+    Returns:
+        Tuple of (data dictionary elements, transfer syntax elements), each a list
+        of (attributes, text) pairs
+    """
+    from lxml import etree
+
+    data_dict_elements = []
+    ts_elements = []
+    # Entries for matched elements that are still open, awaiting their text
+    open_data_dict = []
+    open_ts = []
+
+    # Record matches on "start" so rows stay in document order (nested matches
+    # would otherwise come before their ancestors), and fill in text on "end"
+    for event, elem in etree.iterparse(
+        BytesIO(content.encode("utf-8")),
+        events=("start", "end"),
+        recover=True,
+        huge_tree=True,
+    ):
+        # Strip any "{namespace}" prefix without building a QName per element
+        local_name = elem.tag.rpartition("}")[2]
+        # Look for common DICOM data dictionary structures
+        # This is a simplified version - actual DICOM XML structure varies
+        is_data_element = local_name in _DICOM_DATA_ELEMENT_NAMES
+        is_transfer_syntax = "TransferSyntax" in local_name
+
+        if event == "start":
+            if is_data_element:
+                entry = [dict(elem.attrib), None]
+                data_dict_elements.append(entry)
+                open_data_dict.append(entry)
+            if is_transfer_syntax:
+                entry = [dict(elem.attrib), None]
+                ts_elements.append(entry)
+                open_ts.append(entry)
+            continue
+
+        if is_data_element:
+            open_data_dict.pop()[1] = elem.text
+        if is_transfer_syntax:
+            open_ts.pop()[1] = elem.text
+
+        # Drop the processed subtree and any already-processed siblings. The root
+        # has no parent, but comments/PIs before it still show up as siblings.
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    return (
+        [(attrib, text) for attrib, text in data_dict_elements],
+        [(attrib, text) for attrib, text in ts_elements],
+    )
+
+
+def _extract_dicom_data_dictionary(
+    data_dict_elements: list[tuple[dict, Optional[str]]],
+) -> list[str]:
+    """Format DICOM data dictionary elements as markdown.
+
+    Args:
+        data_dict_elements: (attributes, text) pairs from _scan_dicom_xml
 
     Returns:
         List of markdown lines for data dictionary
     """
     output = ["\n## DICOM Data Dictionary\n"]
 
-    # Look for common DICOM data dictionary structures
-    # This is a simplified version - actual DICOM XML structure varies
-    data_dict_elements = root.xpath(
-        ".//*[contains(local-name(), 'DataElement') or contains(local-name(), 'tag')]"
-    )
-
     if data_dict_elements:
         output.append("| Tag | Name | VR | Description |")
         output.append("|-----|------|----|-----------  |")
 
-        for elem in data_dict_elements[:100]:  # Limit to first 100 for brevity
-            tag = elem.get("tag", "N/A")
-            name = elem.get("name", elem.text or "N/A")
-            vr = elem.get("vr", "N/A")
-            output.append(f"| {tag} | {name} | {vr} | ... |")
+        output.append(
+            "\n".join(
+                f"| {attrib.get('tag', 'N/A')} | {attrib.get('name', text or 'N/A')} "
+                f"| {attrib.get('vr', 'N/A')} | ... |"
+                for attrib, text in data_dict_elements[:_MAX_DATA_DICTIONARY_ROWS]
+            )
+        )
     else:
         output.append(
             "*Data dictionary section found but structure not recognized. Full XML parsing may be needed.*\n"
@@ -254,24 +346,23 @@ def _extract_dicom_data_dictionary(root) -> list[str]:
     return output
 
 
-def _extract_dicom_transfer_syntaxes(root) -> list[str]:
-    """Extract DICOM transfer syntaxes from XML root.
+def _extract_dicom_transfer_syntaxes(
+    ts_elements: list[tuple[dict, Optional[str]]],
+) -> list[str]:
+    """Format DICOM transfer syntax elements as markdown.
 
     Args:
-        root: XML root element
+        ts_elements: (attributes, text) pairs from _scan_dicom_xml
 
     Returns:
         List of markdown lines for transfer syntaxes
     """
     output = ["\n## DICOM Transfer Syntaxes\n"]
 
-    # Look for transfer syntax elements
-    ts_elements = root.xpath(".//*[contains(local-name(), 'TransferSyntax')]")
-
     if ts_elements:
-        for elem in ts_elements:
-            uid = elem.get("uid", elem.text or "N/A")
-            name = elem.get("name", "N/A")
+        for attrib, text in ts_elements:
+            uid = attrib.get("uid", text or "N/A")
+            name = attrib.get("name", "N/A")
             output.append(f"- **{name}**: `{uid}`")
     else:
         output.append(
@@ -1,10 +1,11 @@
 """Flywheel Gear Development MCP Server.
 
 This server provides Flywheel documentation through MCP tools.
-Documentation is fetched fresh on each server startup.
+Documentation is fetched on startup, reusing the on-disk cache while it is fresh.
 """
 
 import asyncio
+import functools
 import logging
 import logging.handlers
 import os
@@ -67,6 +68,10 @@ app = Server("flywheel-gear-mcp")
 
 # Global state
 _initialized = False
+_refresh_task: asyncio.Task | None = None
+
+# Serializes initialization so concurrent first requests don't each fetch docs
+_init_lock = asyncio.Lock()
 
 
 @app.list_tools()
@@ -81,7 +86,7 @@ async def list_tools() -> list[Tool]:
 
     # Load tool definitions from config
     config_path = _find_config_path()
-    tool_defs = tools.load_tool_definitions(config_path)
+    tool_defs = await tools.load_tool_definitions(config_path)
 
     # Add the special list_docs tool
     tool_defs.append(tools.create_list_docs_tool())
@@ -125,36 +130,63 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 
 async def _ensure_initialized():
-    """Ensure the server is initialized with fresh documentation."""
-    global _initialized
+    """Ensure the server is initialized with documentation.
+
+    If every source is in the on-disk cache, that (possibly stale) content is
+    served immediately and refreshed in the background. Otherwise the first
+    call blocks until all sources have been fetched.
+    """
+    global _initialized, _refresh_task
 
     if _initialized:
         return
 
-    logger.info("Initializing Flywheel Gear MCP Server...")
+    async with _init_lock:
+        # Another request may have finished initializing while we waited
+        if _initialized:
+            return
 
-    # Find config file
-    config_path = _find_config_path()
+        logger.info("Initializing Flywheel Gear MCP Server...")
 
-    if not os.path.exists(config_path):
-        logger.error(f"Configuration file not found: {config_path}")
-        logger.error(
-            "Please ensure config.yaml exists in the project root or current directory."
-        )
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        # Find config file
+        config_path = _find_config_path()
 
-    logger.info(f"Using configuration: {config_path}")
+        if not os.path.exists(config_path):
+            logger.error(f"Configuration file not found: {config_path}")
+            logger.error(
+                "Please ensure config.yaml exists in the project root or current directory."
+            )
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Fetch all documentation sources
+        logger.info(f"Using configuration: {config_path}")
+
+        # Serve cached docs right away and refresh them in the background
+        if await fetcher.load_cached_docs(config_path):
+            logger.info("Serving cached documentation, refreshing in the background...")
+            _initialized = True
+            _refresh_task = asyncio.create_task(_refresh_docs(config_path))
+            return
+
+        # Fetch all documentation sources
+        try:
+            await fetcher.fetch_all_docs(config_path)
+            logger.info("Documentation fetched and cached successfully!")
+            _initialized = True
+        except Exception as e:
+            logger.error(f"Failed to fetch documentation: {e}", exc_info=True)
+            raise
+
+
+async def _refresh_docs(config_path: str):
+    """Re-fetch all documentation in the background, replacing cached content."""
     try:
         await fetcher.fetch_all_docs(config_path)
-        logger.info("Documentation fetched and cached successfully!")
-        _initialized = True
+        logger.info("Background documentation refresh complete")
     except Exception as e:
-        logger.error(f"Failed to fetch documentation: {e}", exc_info=True)
-        raise
+        logger.error(f"Background documentation refresh failed: {e}", exc_info=True)
 
 
+@functools.lru_cache(maxsize=1)
 def _find_config_path() -> str:
     """Find the config.yaml file.
 
@@ -201,7 +233,9 @@ def main():
 
     logger.info("Starting Flywheel Gear MCP Server...")
     logger.info("Logs are being written to: logs/flywheel-gear-mcp.log")
-    logger.info("Documentation will be fetched fresh on first tool call.")
+    logger.info(
+        "Documentation will be fetched (or loaded from cache) on first tool call."
+    )
 
     # Run the server
     from mcp.server.stdio import stdio_server
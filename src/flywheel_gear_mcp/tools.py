@@ -1,16 +1,28 @@
 """Dynamic MCP tool generation based on configuration."""
 
+import io
 import logging
+import os
 from datetime import datetime
 
+import aiofiles
 import yaml
 
 from . import fetcher
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Tool definitions keyed by (config_path, mtime) so edits to the config are picked up
+_config_cache: dict[tuple[str, float], list[dict]] = {}
+
 
-def load_tool_definitions(config_path: str = "config.yaml") -> list[dict]:
+async def load_tool_definitions(config_path: str = "config.yaml") -> list[dict]:
     """Load tool definitions from config file.
 
     Args:
@@ -19,8 +31,15 @@ def load_tool_definitions(config_path: str = "config.yaml") -> list[dict]:
     Returns:
         List of tool definition dictionaries for MCP
     """
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    key = (config_path, os.stat(config_path).st_mtime)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        # Return a copy so callers can append to it without touching the cache
+        return list(cached)
+
+    async with aiofiles.open(config_path, "r") as f:
+        text = await f.read()
+    config = yaml.load(text, Loader=_YamlLoader)
 
     sources = config.get("documentation_sources", [])
     tools = []
@@ -42,7 +61,9 @@ def load_tool_definitions(config_path: str = "config.yaml") -> list[dict]:
         tools.append(tool_def)
 
     logger.info(f"Loaded {len(tools)} tool definitions from {config_path}")
-    return tools
+    _config_cache.clear()
+    _config_cache[key] = tools
+    return list(tools)
 
 
 async def execute_tool(tool_name: str, arguments: dict) -> str:
@@ -61,42 +82,37 @@ async def execute_tool(tool_name: str, arguments: dict) -> str:
         return f"# Error\n\nDocumentation for '{tool_name}' not found in cache. Please restart the server."
 
     # Format response with metadata
-    output = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    output.append(f"# {doc['display_name']}")
-    output.append("")
+    w(f"# {doc['display_name']}\n\n")
 
     if doc.get("description"):
-        output.append(f"*{doc['description']}*")
-        output.append("")
+        w(f"*{doc['description']}*\n\n")
 
     # Metadata
-    output.append("## Metadata")
-    output.append("")
-    output.append(f"- **Source URL(s):** {', '.join(doc['urls'])}")
-
     fetched_at = doc.get("fetched_at")
     if isinstance(fetched_at, datetime):
-        output.append(f"- **Fetched:** {fetched_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    else:
-        output.append(f"- **Fetched:** {fetched_at}")
-
+        fetched_at = fetched_at.strftime("%Y-%m-%d %H:%M:%S")
     size_kb = doc.get("size", 0) / 1024
-    output.append(f"- **Size:** {size_kb:.1f} KB")
-    output.append("")
+
+    w(
+        "## Metadata\n\n"
+        f"- **Source URL(s):** {', '.join(doc['urls'])}\n"
+        f"- **Fetched:** {fetched_at}\n"
+        f"- **Size:** {size_kb:.1f} KB\n\n"
+    )
 
     # Check for errors
     if "error" in doc:
-        output.append(f"⚠️ **Warning:** Partial or failed fetch - {doc['error']}")
-        output.append("")
+        w(f"⚠️ **Warning:** Partial or failed fetch - {doc['error']}\n\n")
 
     # Content
-    output.append("---")
-    output.append("")
-    output.append(doc["content"])
+    w("---\n\n")
+    w(doc["content"])
 
-    return "\n".join(output)
+    return buf.getvalue()
 
 
 def create_list_docs_tool() -> dict:
@@ -123,33 +139,29 @@ async def execute_list_docs_tool(arguments: dict) -> str:
     """
     all_docs = fetcher.get_all_cached_docs()
 
-    output = ["# Available Flywheel Documentation Sources\n"]
+    buf = io.StringIO()
+    w = buf.write
+
+    w("# Available Flywheel Documentation Sources\n\n")
 
     if not all_docs:
-        output.append(
-            "*No documentation currently cached. Server may still be starting up.*\n"
-        )
-        return "\n".join(output)
+        w("*No documentation currently cached. Server may still be starting up.*\n")
+        return buf.getvalue()
 
-    output.append(f"Total sources: {len(all_docs)}\n")
+    w(f"Total sources: {len(all_docs)}\n")
 
     for tool_name, doc in all_docs.items():
-        output.append(f"## `{tool_name}`")
-        output.append(f"**{doc['display_name']}**")
+        w(f"\n## `{tool_name}`\n**{doc['display_name']}**\n")
 
         if doc.get("description"):
-            output.append(f"\n*{doc['description']}*")
-
-        output.append(f"\n- URLs: {len(doc['urls'])}")
+            w(f"\n*{doc['description']}*\n")
 
         size_kb = doc.get("size", 0) / 1024
-        output.append(f"- Size: {size_kb:.1f} KB")
+        w(f"\n- URLs: {len(doc['urls'])}\n- Size: {size_kb:.1f} KB\n")
 
         if "error" in doc:
-            output.append(f"- ⚠️ Status: Error - {doc['error']}")
+            w(f"- ⚠️ Status: Error - {doc['error']}\n")
         else:
-            output.append("- ✓ Status: Successfully cached")
-
-        output.append("")
+            w("- ✓ Status: Successfully cached\n")
 
-    return "\n".join(output)
+    return buf.getvalue()
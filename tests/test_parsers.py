@@ -0,0 +1,31 @@
+"""Tests for documentation parsers."""
+
+import pytest
+
+from flywheel_gear_mcp import parsers
+
+
+@pytest.mark.parametrize(
+    "prolog",
+    ["<!-- comment -->", '<?xml-model href="dicom.rng"?>'],
+)
+def test_parse_xml_filtered_with_node_before_root(prolog):
+    content = (
+        f'<?xml version="1.0"?>{prolog}'
+        '<root><DataElement tag="(0010,0010)" name="Patient Name" vr="PN"/></root>'
+    )
+
+    result = parsers.parse_xml(content, ["data_dictionary"])
+
+    assert "| (0010,0010) | Patient Name | PN | ... |" in result
+
+
+def test_parse_xml_filtered_keeps_document_order_for_nested_elements():
+    content = (
+        '<root><DataElement tag="(0010,0010)" name="Patient Name">'
+        "<tag>inner</tag></DataElement></root>"
+    )
+
+    result = parsers.parse_xml(content, ["data_dictionary"])
+
+    assert result.index("Patient Name") < result.index("inner")
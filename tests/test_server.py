@@ -0,0 +1,32 @@
+"""Tests for server initialization."""
+
+import asyncio
+
+from flywheel_gear_mcp import fetcher, server
+
+
+def test_concurrent_first_requests_start_one_refresh(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("documentation_sources: []\n")
+    refreshes = []
+
+    async def load_cached_docs(path):
+        await asyncio.sleep(0)  # Yield so the other request reaches the guard
+        return True
+
+    async def fetch_all_docs(path):
+        refreshes.append(path)
+
+    monkeypatch.setattr(server, "_find_config_path", lambda: str(config_path))
+    monkeypatch.setattr(server, "_initialized", False)
+    monkeypatch.setattr(server, "_refresh_task", None)
+    monkeypatch.setattr(fetcher, "load_cached_docs", load_cached_docs)
+    monkeypatch.setattr(fetcher, "fetch_all_docs", fetch_all_docs)
+
+    async def run():
+        await asyncio.gather(server._ensure_initialized(), server._ensure_initialized())
+        await server._refresh_task
+
+    asyncio.run(run())
+
+    assert refreshes == [str(config_path)]